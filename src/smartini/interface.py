@@ -1176,13 +1176,14 @@ class _ReadIni:
 class SlotView:
     """Parent class for slot access."""
 
+    __slots__ = ("_target",)
+
     def __init__(self, target: Schema | Section) -> None:
         """
         Args:
             target (Schema | Section): The target that is accessed.
         """
-        super().__setattr__("_target", target)
-        super().__setattr__("_slot_views", {})
+        object.__setattr__(self, "_target", target)
 
     def _slot_access(self, access_target: Callable, slot: SlotAccess) -> Callable:
         """Access a callable and set the slot accordingly.
@@ -1217,10 +1218,10 @@ class SlotView:
         Raises:
             AttributeError: If any other than in option is tried to be set.
         """
-        target, attr = super().__getattribute__("_get_target_attr")(name)
+        target, attr = object.__getattribute__(self, "_get_target_attr")(name)
         if not (isinstance(attr, Option) and isinstance(target, Section)):
             raise AttributeError("Assignment only valid for options.")
-        super().__getattribute__("_slot_access")(
+        object.__getattribute__(self, "_slot_access")(
             access_target=target._set_option, slot=slot
         )(name=name, value=value)
 
@@ -1233,7 +1234,7 @@ class SlotView:
         Returns:
             tuple[Schema | Section, Any]: Target and the attribute.
         """
-        target = super().__getattribute__("_target")
+        target = object.__getattribute__(self, "_target")
         attr = target.__dict__.get(name, None) or getattr(target, name)
         return (target, attr)
 
@@ -1241,6 +1242,8 @@ class SlotView:
 class SlotDecider(SlotView):
     """Gives access to slots by deciding."""
 
+    __slots__ = ("_slots", "_decider_method")
+
     def __init__(
         self, target: Schema | Section, slots: Slots, decider_method: SlotDeciderMethods
     ) -> None:
@@ -1251,34 +1254,34 @@ class SlotDecider(SlotView):
             decider_method (SlotDeciderMethods): The method to use for decision.
         """
         super().__init__(target=target)
-        super().__setattr__("_decider_method", decider_method)
-        super().__setattr__("_slots", slots)
+        object.__setattr__(self, "_decider_method", decider_method)
+        object.__setattr__(self, "_slots", slots)
 
     def __getattribute__(self, name: str) -> Any:
-        target, attr = super().__getattribute__("_get_target_attr")(name)
+        target, attr = object.__getattribute__(self, "_get_target_attr")(name)
 
         if isinstance(attr, Option):
-            return super().__getattribute__("_decide_slot")(attr)[1].converted
+            return object.__getattribute__(self, "_decide_slot")(attr)[1].converted
         elif isinstance(attr, Section):
             return SlotDecider(
                 attr,
-                super().__getattribute__("_slots"),
-                super().__getattribute__("_decider_method"),
+                object.__getattribute__(self, "_slots"),
+                object.__getattribute__(self, "_decider_method"),
             )
         elif (
             not name.startswith("__")
             and callable(attr)
             and SlotAccess in get_type_hints(attr).values()
         ):
-            slot_key = super().__getattribute__("_decide_slot")(target)[0]
-            return super().__getattribute__("_slot_access")(attr, slot_key)
+            slot_key = object.__getattribute__(self, "_decide_slot")(target)[0]
+            return object.__getattribute__(self, "_slot_access")(attr, slot_key)
 
         return attr
 
     def __setattr__(self, name: str, value: Any) -> None:
-        _, attr = super().__getattribute__("_get_target_attr")(name)
-        slot = super().__getattribute__("_decide_slot")(attr)[0]
-        super().__getattribute__("_set_slot")(name, value, slot)
+        _, attr = object.__getattribute__(self, "_get_target_attr")(name)
+        slot = object.__getattribute__(self, "_decide_slot")(attr)[0]
+        object.__getattribute__(self, "_set_slot")(name, value, slot)
 
     def _decide_slot(self, target: Option | Section) -> tuple[
         SlotKey,
@@ -1294,10 +1297,10 @@ class SlotDecider(SlotView):
                 decided slot's key and value.
 
         """
-        decider_method: SlotDeciderMethods = super().__getattribute__("_decider_method")
-        slots: Slots = super().__getattribute__("_slots")
+        decider_method: SlotDeciderMethods = object.__getattribute__(self, "_decider_method")
+        slots: Slots = object.__getattribute__(self, "_slots")
 
-        return super().__getattribute__("_decision")(
+        return object.__getattribute__(self, "_decision")(
             target=target, reference_slots=slots, method=decider_method
         )
 
@@ -1350,6 +1353,8 @@ class SlotDecider(SlotView):
 class SlotViewer(SlotView):
     """Gives access to a specific slot."""
 
+    __slots__ = ("_slot",)
+
     def __init__(
         self,
         target: Schema | Section,
@@ -1361,7 +1366,7 @@ class SlotViewer(SlotView):
             slot (SlotAccess): The slot to access.
         """
         super().__init__(target=target)
-        super().__setattr__("_slot", slot)
+        object.__setattr__(self, "_slot", slot)
 
     def __getattribute__(self, name: str) -> Any:
 
@@ -1373,10 +1378,10 @@ class SlotViewer(SlotView):
             "__call__",
             "__class__",
         }:
-            return super().__getattribute__(name)
+            return object.__getattribute__(self, name)
 
-        target, attr = super().__getattribute__("_get_target_attr")(name)
-        slot: SlotAccess = super().__getattribute__("_slot")
+        target, attr = object.__getattribute__(self, "_get_target_attr")(name)
+        slot: SlotAccess = object.__getattribute__(self, "_slot")
 
         # Schema[].Section
         if isinstance(attr, Section):
@@ -1393,18 +1398,20 @@ class SlotViewer(SlotView):
 
         # Schema[].Section.(SlotAccess)
         elif callable(attr):
-            return super().__getattribute__("_slot_access")(attr, slot)
+            return object.__getattribute__(self, "_slot_access")(attr, slot)
 
         return attr
 
     def __setattr__(self, name: str, value: Any) -> None:
-        slot: SlotAccess = super().__getattribute__("_slot")
-        super().__getattribute__("_set_slot")(name, value, slot)
+        slot: SlotAccess = object.__getattribute__(self, "_slot")
+        object.__getattribute__(self, "_set_slot")(name, value, slot)
 
 
 class SlotIlocViewer(SlotView):
     """Gives access to a specific slot by index."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         target: Schema,
@@ -1418,7 +1425,7 @@ class SlotIlocViewer(SlotView):
     def __getitem__(self, index: int) -> SlotViewer:
         if not isinstance(index, int):
             raise ValueError("Indexing only works with int.")
-        target: Schema = super().__getattribute__("_target")
+        target: Schema = object.__getattribute__(self, "_target")
         try:
             requested_slot = target._slots.iloc[index][0]
         except IndexError as e:
@@ -8,7 +8,7 @@ from typing import (
     Any,
     Sequence,
 )
-from .utils import OrderedDict
+from .utils import OrderedDict, _iLocIndexer
 from .exceptions_warnings import (
     SlotNotFound,
     SlotAlreadyExists,
@@ -35,7 +35,7 @@ list[SlotKey] for multiple slots and None for all slots.
 """
 
 
-class Slots[SlotValue](OrderedDict[SlotKey, SlotValue]):
+class Slots[SlotValue](dict[SlotKey, SlotValue]):
     """Container for slots."""
 
     def __init__(self, value_type: type[SlotValue], *args, **kwargs) -> None:
@@ -44,6 +44,7 @@ class Slots[SlotValue](OrderedDict[SlotKey, SlotValue]):
             value_type (type[SlotValue]): Type this container's values should have.
         """
         self._value_type = value_type
+        self.iloc: _iLocIndexer[SlotKey, SlotValue] = _iLocIndexer(self)
         super().__init__(*args, **kwargs)
 
     @overload
@@ -73,6 +74,7 @@ class Slots[SlotValue](OrderedDict[SlotKey, SlotValue]):
         """
         if keys is None:
             return
+        value_type = self._value_type
         for key in keys if isinstance(keys, list) else (keys,):
             if key in self:
                 if not exist_ok:
@@ -80,9 +82,7 @@ class Slots[SlotValue](OrderedDict[SlotKey, SlotValue]):
                         "Can't add slot with key '{key}' because it already exists."
                     )
             else:
-                self[key] = (
-                    self._value_type if self._value_type is None else self._value_type()
-                )
+                self[key] = value_type if value_type is None else value_type()
 
     def slot_access(
         self, slot_access: SlotAccess, verify: bool | None = None
@@ -147,7 +147,7 @@ class Slots[SlotValue](OrderedDict[SlotKey, SlotValue]):
             # one slot, interpret the list as one value for the slot
             values_per_slot = [values_per_slot]
 
-        for slot, value in zip(self.slot_access(slots), values_per_slot):
+        for slot, value in zip(slots, values_per_slot):
             if slot not in self:
                 if not create_missing_slots:
                     raise IndexError(
@@ -417,32 +417,29 @@ class _StructureSlotEntity[StructureItem](_SlotEntity[Structure[StructureItem]])
             items = [items]
 
         for s, pos in zip(slots, validated_positions):
+            slot_list = self._slots[s]
+
             # define slice for inserting
             pos_slice = (
-                slice(len(self._slots[s]), len(self._slots[s]))
-                if pos is None
-                else slice(pos, pos)
+                slice(len(slot_list), len(slot_list)) if pos is None else slice(pos, pos)
             )
 
             items_set = set(items)
 
             # check for duplicates
-            if dupl := items_set.intersection(self._slots[s]):
+            if dupl := items_set.intersection(slot_list):
                 match handle_dupl(pos):
                     case "ignore":
-                        self._slots[s][pos_slice] = items_set.difference(dupl)
+                        slot_list[pos_slice] = items_set.difference(dupl)
                     case "move":
-                        new_slot = []
-                        for i, v in enumerate(self._slots[s]):
-                            if i == pos_slice.start:
-                                new_slot.extend(items)
-                            if v not in dupl:
-                                new_slot.append(v)
+                        # remove the duplicates and insert all items at the position
+                        slot_list[:] = [v for v in slot_list if v not in dupl]
+                        slot_list[pos_slice] = items
                     case _:  # includes "exception"
                         raise DuplicateEntityError(f"Items {dupl} already exist.")
             else:
                 # no duplicates
-                self._slots[s][pos_slice] = items
+                slot_list[pos_slice] = items
 
     def _set_structure(
         self,
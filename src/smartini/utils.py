@@ -63,7 +63,7 @@ class OrderedDict(OD[_KT, _VT]):
 
 class _iLocIndexer(Generic[_KT, _VT]):
 
-    def __init__(self, target: OrderedDict[_KT, _VT]) -> None:
+    def __init__(self, target: dict[_KT, _VT]) -> None:
         self.target = target
 
     @overload
@@ -1,5 +1,5 @@
 from .base import Base
-from smartini import exceptions_warnings, Parameters, VALID_MARKERS
+from smartini import exceptions_warnings, Parameters, VALID_MARKERS, Option, Comment
 from smartini.utils import _str_to_var
 import pytest
 from typing import get_args
@@ -266,6 +266,19 @@ class TestParameters:
             },
         ]
     )
+    # moving an option inside the structure
+    test_parameters.append(
+        {
+            "opt_val": "1",
+            "opt_result": 1,
+            "further": lambda sch, sec, opt, com: getattr(sch, sec).set_option(
+                opt, "2", positions=0
+            )
+            is None
+            and [type(e) for e in object.__getattribute__(sch, sec)[0]]
+            == [Option, Comment],
+        }
+    )
 
     # ----------
     # type converters